@@ -7,8 +7,12 @@ Uses plain-text labeled output for maximum API compatibility.
 
 import re
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 import requests
-from prompts import get_round1_messages, get_round2_messages, get_round3_messages
+from prompts import (
+    get_round1_messages, get_round2_messages, get_round2_independent_messages,
+    get_round3_messages,
+)
 
 
 class DetectionError(Exception):
@@ -130,12 +134,18 @@ class AIDetector:
     """Multi-round AI content detector using LLM analysis."""
 
     def __init__(self, api_base: str, api_key: str, model: str,
-                 temperature: float = 0.1, timeout: int = 120):
+                 temperature: float = 0.1, timeout: int = 120,
+                 parallel_rounds: bool = False, normalizer=None):
         self.api_base = api_base.rstrip("/")
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
+        # When enabled, Round 2 uses a prompt that does not depend on Round 1
+        # so both rounds can be dispatched concurrently.
+        self.parallel_rounds = parallel_rounds
+        # Optional TextNormalizer applied to the input before any prompt is built.
+        self.normalizer = normalizer
 
     def _chat(self, messages: list) -> str:
         """Send a chat completion request to the OpenAI-compatible API."""
@@ -181,33 +191,33 @@ class AIDetector:
         if not text or not text.strip():
             raise DetectionError("Input text is empty.")
 
+        original_length = len(text)
+        normalization = None
+        placeholders = False
+        if self.normalizer is not None:
+            text, normalization = self.normalizer.normalize(text)
+            if not text:
+                raise DetectionError("Input text is empty after normalization.")
+            placeholders = bool(normalization["urls_replaced"] or normalization["code_blocks_replaced"])
+
         if len(text.strip()) < 50:
+            if normalization is not None and original_length >= 50:
+                raise DetectionError(
+                    f"Input text is too short after normalization ({original_length} -> "
+                    f"{len(text)} characters; minimum 50) for reliable analysis. "
+                    "Disable normalization or the steps that removed the content."
+                )
             raise DetectionError("Input text is too short (minimum 50 characters) for reliable analysis.")
 
         start = time.time()
 
-        # ── Round 1: Initial Feature Extraction ──
-        if progress_callback:
-            progress_callback(1, "Initial Feature Extraction", None)
-
-        r1_messages = get_round1_messages(text)
-        r1_raw = self._chat(r1_messages)
+        if self.parallel_rounds:
+            r1_raw, r2_raw = self._run_rounds_parallel(text, progress_callback, placeholders)
+        else:
+            r1_raw, r2_raw = self._run_rounds_sequential(text, progress_callback, placeholders)
         r1_parsed = _parse_round1(r1_raw)
-
-        if progress_callback:
-            progress_callback(1, "Initial Feature Extraction", r1_raw)
-
-        # ── Round 2: Deep Pattern Analysis ──
-        if progress_callback:
-            progress_callback(2, "Deep Pattern Analysis", None)
-
-        r2_messages = get_round2_messages(text, r1_raw)
-        r2_raw = self._chat(r2_messages)
         r2_parsed = _parse_round2(r2_raw)
 
-        if progress_callback:
-            progress_callback(2, "Deep Pattern Analysis", r2_raw)
-
         # ── Round 3: Final Synthesis ──
         if progress_callback:
             progress_callback(3, "Final Synthesis & Verdict", None)
@@ -234,7 +244,62 @@ class AIDetector:
                 "round2_deep_analysis": r2_parsed,
             },
             "elapsed_seconds": elapsed,
-            "text_length": len(text),
+            "text_length": original_length,
+            "input_normalization": normalization,
             "model_used": self.model,
+            "pipeline_mode": "parallel" if self.parallel_rounds else "sequential",
         }
         return final
+
+    def _run_rounds_sequential(self, text: str, progress_callback=None,
+                               placeholders: bool = False) -> tuple:
+        """Run Round 1, then a Round 2 that builds on Round 1's output."""
+        # ── Round 1: Initial Feature Extraction ──
+        if progress_callback:
+            progress_callback(1, "Initial Feature Extraction", None)
+
+        r1_raw = self._chat(get_round1_messages(text, placeholders))
+
+        if progress_callback:
+            progress_callback(1, "Initial Feature Extraction", r1_raw)
+
+        # ── Round 2: Deep Pattern Analysis ──
+        if progress_callback:
+            progress_callback(2, "Deep Pattern Analysis", None)
+
+        r2_raw = self._chat(get_round2_messages(text, r1_raw, placeholders))
+
+        if progress_callback:
+            progress_callback(2, "Deep Pattern Analysis", r2_raw)
+
+        return r1_raw, r2_raw
+
+    def _run_rounds_parallel(self, text: str, progress_callback=None,
+                             placeholders: bool = False) -> tuple:
+        """Run Round 1 and an independent Round 2 concurrently."""
+        if progress_callback:
+            progress_callback(1, "Initial Feature Extraction", None)
+            progress_callback(2, "Deep Pattern Analysis", None)
+
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            r1_future = pool.submit(self._chat, get_round1_messages(text, placeholders))
+            r2_future = pool.submit(self._chat, get_round2_independent_messages(text, placeholders))
+            # Return as soon as either round fails rather than waiting out the
+            # other round's timeout; .result() re-raises its DetectionError.
+            done, _ = wait([r1_future, r2_future], return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    future.result()
+            r1_raw = r1_future.result()
+            r2_raw = r2_future.result()
+        finally:
+            # The surviving request, if any, finishes in the background (up to
+            # self.timeout) after the scheduler slot has been released.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if progress_callback:
+            progress_callback(1, "Initial Feature Extraction", r1_raw)
+            progress_callback(2, "Deep Pattern Analysis", r2_raw)
+
+        return r1_raw, r2_raw
@@ -0,0 +1,233 @@
+"""
+AI Generated Content Detector - Input Normalization
+
+Configurable clean-up pipeline applied to submitted text before prompt
+construction. Removes content that costs prompt tokens in every round but
+carries no authorship signal: markup remnants, long URLs, code blocks,
+email signatures, duplicated paragraphs and runs of whitespace.
+"""
+
+import html
+import re
+
+
+URL_PLACEHOLDER = "[URL]"
+CODE_PLACEHOLDER = "[CODE BLOCK]"
+
+_FENCED_CODE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
+_PRE_BLOCK = re.compile(r"<pre\b[^>]*>.*?</pre>", re.DOTALL | re.IGNORECASE)
+_SCRIPT_STYLE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+_BLOCK_TAG = re.compile(r"<\s*(br|/p|/div|/li|/h[1-6]|/tr)\b[^>]*>", re.IGNORECASE)
+_HTML_TAG_NAMES = (
+    "a|abbr|article|aside|b|blockquote|body|br|caption|cite|code|div|em|"
+    "figcaption|figure|font|footer|h[1-6]|head|header|hr|html|i|img|li|link|"
+    "main|meta|nav|ol|p|pre|section|small|span|strong|sub|sup|table|tbody|td|"
+    "th|thead|title|tr|u|ul"
+)
+_TAG = re.compile(rf"</?(?:{_HTML_TAG_NAMES})\b[^<>]*>|<!--.*?-->", re.DOTALL | re.IGNORECASE)
+# Markup is only stripped when the text carries unambiguous HTML evidence:
+# a closing tag, a void tag, a comment or a doctype. Prose such as
+# "if a<b and c>d" has none of these and is left untouched.
+_HTML_EVIDENCE = re.compile(
+    rf"</(?:{_HTML_TAG_NAMES})\s*>|<(?:br|hr|img)\b[^<>]*/?>|<!--|<!doctype\b",
+    re.IGNORECASE,
+)
+_URL = re.compile(r"\b(?:https?://|www\.)[^\s<>\"'\]]+", re.IGNORECASE)
+_URL_TRAILING = ".,;:!?"
+_SIGNATURE_DELIMITER = re.compile(r"^--[ \t]*$")
+_SENT_FROM = re.compile(r"^sent from my [\w .'-]{1,40}$", re.IGNORECASE)
+_CONTACT = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.-]+"                   # email address
+    r"|\+?\d[\d ().-]{6,}\d"                        # phone number
+    r"|\b(?:tel|phone|mobile|fax|email|e-mail)\s*[:.]"  # contact label
+    r"|^(?:https?://|www\.)\S+$|^\[URL\]$",
+    re.IGNORECASE,
+)
+_SIGNATURE_MAX_LINES = 6
+_SIGNATURE_MAX_LINE_LENGTH = 60
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+
+
+def _replace_url(match) -> str:
+    """
+    Replace one URL with the placeholder, keeping trailing punctuation.
+
+    Sentence punctuation and closing parentheses without a matching opener
+    inside the URL (e.g. "(see https://x.org/a(b))") belong to the prose.
+    """
+    url = match.group(0)
+    end = len(url)
+    while end:
+        char = url[end - 1]
+        if char in _URL_TRAILING:
+            end -= 1
+        elif char == ")" and url.count("(", 0, end) < url.count(")", 0, end):
+            end -= 1
+        else:
+            break
+    return URL_PLACEHOLDER + url[end:]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate without a tokenizer.
+
+    CJK characters count as one token each; other text is estimated at
+    four characters per token, the usual rule of thumb for English BPE.
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK.findall(text))
+    other = len(text) - cjk
+    return cjk + (other + 3) // 4
+
+
+# Steps that can remove authorship signal Round 1 scores (repetition,
+# burstiness, layout). They stay off unless requested explicitly until
+# test_accuracy.py --compare-normalize shows accuracy is unaffected.
+LOSSY_STEPS = ("collapse_whitespace", "dedupe_paragraphs")
+
+
+class TextNormalizer:
+    """Token-reducing normalization pipeline with individually toggled steps."""
+
+    def __init__(self, strip_markup: bool = True, replace_code_blocks: bool = True,
+                 replace_urls: bool = True, strip_signatures: bool = True,
+                 dedupe_paragraphs: bool = False, collapse_whitespace: bool = False):
+        self.strip_markup = strip_markup
+        self.replace_code_blocks = replace_code_blocks
+        self.replace_urls = replace_urls
+        self.strip_signatures = strip_signatures
+        self.dedupe_paragraphs = dedupe_paragraphs
+        self.collapse_whitespace = collapse_whitespace
+
+    @classmethod
+    def from_options(cls, options) -> "TextNormalizer":
+        """
+        Build a normalizer from an API option value.
+
+        Accepts a bool or a dict of step name to bool. True enables the
+        default steps (everything except LOSSY_STEPS) and False disables all
+        of them; steps missing from a dict keep their defaults.
+
+        Raises:
+            ValueError: If options is not a bool or dict, the dict contains an
+                unknown step name, or a step value is not a bool.
+        """
+        steps = cls().steps()
+        if isinstance(options, bool):
+            return cls() if options else cls(**{name: False for name in steps})
+        if not isinstance(options, dict):
+            raise ValueError("Normalize must be true, false, or an object of step flags.")
+        unknown = sorted(set(options) - set(steps))
+        if unknown:
+            raise ValueError(f"Unknown normalization step(s): {', '.join(unknown)}.")
+        not_bool = sorted(name for name, value in options.items() if not isinstance(value, bool))
+        if not_bool:
+            raise ValueError(f"Normalization step flags must be true or false: {', '.join(not_bool)}.")
+        return cls(**options)
+
+    @property
+    def enabled(self) -> bool:
+        """True if at least one step is switched on."""
+        return any(self.steps().values())
+
+    def steps(self) -> dict:
+        """Step name to enabled flag, in the order they are applied."""
+        return {
+            "replace_code_blocks": self.replace_code_blocks,
+            "strip_markup": self.strip_markup,
+            "replace_urls": self.replace_urls,
+            "strip_signatures": self.strip_signatures,
+            "collapse_whitespace": self.collapse_whitespace,
+            "dedupe_paragraphs": self.dedupe_paragraphs,
+        }
+
+    def normalize(self, text: str) -> tuple:
+        """
+        Apply all enabled steps to the text.
+
+        Returns:
+            (normalized_text, stats) where stats reports original and
+            normalized length and token estimates, the steps applied and how
+            many URL and code-block placeholders were inserted.
+        """
+        result = text.replace("\r\n", "\n").replace("\r", "\n")
+        code_blocks = urls = 0
+
+        if self.replace_code_blocks:
+            result, fenced = _FENCED_CODE.subn(CODE_PLACEHOLDER, result)
+            result, pre = _PRE_BLOCK.subn(CODE_PLACEHOLDER, result)
+            code_blocks = fenced + pre
+
+        if self.strip_markup and _HTML_EVIDENCE.search(result):
+            result = _SCRIPT_STYLE.sub("", result)
+            result = _BLOCK_TAG.sub("\n", result)
+            result = _TAG.sub("", result)
+            result = html.unescape(result)
+
+        if self.replace_urls:
+            result, urls = _URL.subn(_replace_url, result)
+
+        if self.strip_signatures:
+            result = self._strip_signature(result)
+
+        if self.collapse_whitespace:
+            result = result.replace("\u00a0", " ")
+            result = re.sub(r"[ \t\f\v]+", " ", result)
+            result = re.sub(r" *\n *", "\n", result)
+            result = re.sub(r"\n{3,}", "\n\n", result)
+
+        if self.dedupe_paragraphs:
+            result = self._dedupe_paragraphs(result)
+
+        result = result.strip()
+
+        stats = {
+            "original_length": len(text),
+            "normalized_length": len(result),
+            "original_tokens_est": estimate_tokens(text),
+            "normalized_tokens_est": estimate_tokens(result),
+            "steps_applied": [name for name, enabled in self.steps().items() if enabled],
+            "urls_replaced": urls,
+            "code_blocks_replaced": code_blocks,
+        }
+        return result, stats
+
+    @staticmethod
+    def _strip_signature(text: str) -> str:
+        """
+        Remove a trailing email signature block.
+
+        Only signature-shaped endings are removed: a lone "Sent from my ..."
+        last line, or a "--" delimiter followed by a few short lines that
+        include contact details (email, phone or URL). A "--" used as a
+        section break before ordinary prose is kept.
+        """
+        lines = text.rstrip().split("\n")
+        if lines and _SENT_FROM.match(lines[-1].strip()):
+            lines.pop()
+
+        for i in range(len(lines) - 1, max(-1, len(lines) - _SIGNATURE_MAX_LINES - 2), -1):
+            if not _SIGNATURE_DELIMITER.match(lines[i]):
+                continue
+            tail = [line.strip() for line in lines[i + 1:] if line.strip()]
+            if (tail and len(tail) <= _SIGNATURE_MAX_LINES
+                    and all(len(line) <= _SIGNATURE_MAX_LINE_LENGTH for line in tail)
+                    and any(_CONTACT.search(line) for line in tail)):
+                lines = lines[:i]
+            break
+        return "\n".join(lines)
+
+    @staticmethod
+    def _dedupe_paragraphs(text: str) -> str:
+        """Drop paragraphs that repeat an earlier one, ignoring case and spacing."""
+        seen = set()
+        kept = []
+        for para in re.split(r"\n\s*\n", text):
+            key = " ".join(para.split()).lower()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            kept.append(para)
+        return "\n\n".join(kept)
@@ -71,9 +71,7 @@ Perform your initial feature extraction analysis. Remember to use the exact labe
 # Round 2: Deep Pattern Analysis with Context from Round 1
 # ──────────────────────────────────────────────────────────────────────
 
-ROUND2_SYSTEM = """You are an expert forensic linguist continuing your analysis of a text sample. You have already performed an initial feature extraction. Now you must conduct a DEEP PATTERN ANALYSIS focusing on the most discriminative features.
-
-## Deep Analysis Protocol
+ROUND2_PROTOCOL = """## Deep Analysis Protocol
 
 ### A. Statistical Micro-Patterns
 - Sentence opening diversity: Count how many sentences start with the same word or similar structures. AI text often starts sentences with The, This, It, However at higher rates.
@@ -111,6 +109,10 @@ KEY_EVIDENCE_1: [most compelling evidence point]
 KEY_EVIDENCE_2: [second most compelling evidence point]
 KEY_EVIDENCE_3: [third most compelling evidence point]"""
 
+ROUND2_SYSTEM = """You are an expert forensic linguist continuing your analysis of a text sample. You have already performed an initial feature extraction. Now you must conduct a DEEP PATTERN ANALYSIS focusing on the most discriminative features.
+
+""" + ROUND2_PROTOCOL
+
 ROUND2_USER_TEMPLATE = """Here is my initial analysis result:
 {round1_result}
 
@@ -123,6 +125,24 @@ Based on these initial findings, please now conduct the deep pattern analysis on
 Focus especially on the dimensions that showed the strongest AI signals in the initial analysis. Use the exact label format specified."""
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Round 2 (Independent): Deep Pattern Analysis without Round 1 context
+# Used by parallel-round mode, where Rounds 1 and 2 run concurrently.
+# ──────────────────────────────────────────────────────────────────────
+
+ROUND2_INDEPENDENT_SYSTEM = """You are an expert forensic linguist specializing in distinguishing AI-generated text from human-written text. A colleague is separately scoring the text's surface features (lexical diversity, burstiness, discourse structure). Your job is to conduct a DEEP PATTERN ANALYSIS of the text on its own, focusing on the most discriminative features.
+
+""" + ROUND2_PROTOCOL
+
+ROUND2_INDEPENDENT_USER_TEMPLATE = """Please conduct the deep pattern analysis on the following text sample:
+
+---TEXT START---
+{text}
+---TEXT END---
+
+Judge each dimension from the text alone. Use the exact label format specified."""
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Round 3: Final Synthesis & Verdict
 # ──────────────────────────────────────────────────────────────────────
@@ -189,22 +209,45 @@ Now please synthesize all findings and deliver your final verdict. Remember to:
 4. Use the exact label format specified above"""
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Placeholder note: appended to Round 1/2 user messages only when input
+# normalization replaced URLs or code blocks with placeholders.
+# ──────────────────────────────────────────────────────────────────────
+
+PLACEHOLDER_NOTE = """Note: [URL] and [CODE BLOCK] in the text are placeholders inserted by our pre-processing for removed links and source code; they were not written by the author, so do not treat them as evidence either way."""
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Helper: Get conversation rounds
 # ──────────────────────────────────────────────────────────────────────
 
-def get_round1_messages(text: str) -> list:
+def _with_placeholder_note(content: str, placeholders: bool) -> str:
+    return f"{content}\n\n{PLACEHOLDER_NOTE}" if placeholders else content
+
+
+def get_round1_messages(text: str, placeholders: bool = False) -> list:
     return [
         {"role": "system", "content": ROUND1_SYSTEM},
-        {"role": "user", "content": ROUND1_USER_TEMPLATE.format(text=text)},
+        {"role": "user", "content": _with_placeholder_note(
+            ROUND1_USER_TEMPLATE.format(text=text), placeholders
+        )},
     ]
 
 
-def get_round2_messages(text: str, round1_result: str) -> list:
+def get_round2_messages(text: str, round1_result: str, placeholders: bool = False) -> list:
     return [
         {"role": "system", "content": ROUND2_SYSTEM},
-        {"role": "user", "content": ROUND2_USER_TEMPLATE.format(
+        {"role": "user", "content": _with_placeholder_note(ROUND2_USER_TEMPLATE.format(
             text=text, round1_result=round1_result
+        ), placeholders)},
+    ]
+
+
+def get_round2_independent_messages(text: str, placeholders: bool = False) -> list:
+    return [
+        {"role": "system", "content": ROUND2_INDEPENDENT_SYSTEM},
+        {"role": "user", "content": _with_placeholder_note(
+            ROUND2_INDEPENDENT_USER_TEMPLATE.format(text=text), placeholders
         )},
     ]
 
@@ -0,0 +1,215 @@
+"""
+AI Generated Content Detector - Request Scheduler
+
+Priority-lane admission control in front of the detection engine.
+Interactive and batch callers wait in separate bounded lanes and are
+admitted to a fixed pool of worker slots by weighted fair dequeueing.
+"""
+
+import threading
+import time
+from collections import deque
+
+
+LANE_INTERACTIVE = "interactive"
+LANE_BATCH = "batch"
+
+
+class SchedulerSaturated(Exception):
+    """Raised when a request is shed because its lane is saturated."""
+
+    def __init__(self, message: str, lane: str, retry_after: int, stats: dict):
+        super().__init__(message)
+        self.lane = lane
+        self.retry_after = retry_after
+        self.stats = stats
+
+
+def _positive_int(value):
+    """Return value as an int if it is an integer >= 1 (or its digit string), else None."""
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 1:
+        return value
+    return None
+
+
+class _Ticket:
+    """A single queued request waiting for a worker slot."""
+
+    __slots__ = ("lane", "enqueued_at", "granted")
+
+    def __init__(self, lane: str):
+        self.lane = lane
+        self.enqueued_at = time.time()
+        self.granted = False
+
+
+class PriorityScheduler:
+    """Weighted fair scheduler with bounded per-lane queues."""
+
+    def __init__(self, workers: int = 4, weights: dict = None,
+                 max_depth: dict = None, max_wait: float = 300.0):
+        """
+        Args:
+            workers: Number of detections allowed to run concurrently. A
+                detection in parallel-round mode makes two upstream calls at
+                once, so upstream concurrency can reach twice this number.
+                When one parallel round fails, the other keeps running in the
+                background after the slot is released (for up to the
+                detector timeout) and is not counted here, so upstream
+                concurrency can briefly exceed even that bound.
+            weights: Relative dequeue share per lane, e.g. {"interactive": 4, "batch": 1}.
+            max_depth: Maximum number of waiting requests per lane.
+            max_wait: Seconds a request may wait for a slot before it is shed.
+
+        Raises:
+            ValueError: If workers is below 1, a weight is not a positive
+                integer, or max_depth does not give every lane a depth of at
+                least 1.
+        """
+        weights = weights or {LANE_INTERACTIVE: 4, LANE_BATCH: 1}
+        max_depth = max_depth or {LANE_INTERACTIVE: 32, LANE_BATCH: 256}
+        if _positive_int(workers) is None:
+            raise ValueError(f"Scheduler needs at least 1 worker, got {workers!r}.")
+        bad_weights = sorted(lane for lane, weight in weights.items() if _positive_int(weight) is None)
+        if bad_weights:
+            raise ValueError(f"Lane weights must be integers >= 1: {', '.join(bad_weights)}.")
+        missing = sorted(set(weights) - set(max_depth))
+        if missing:
+            raise ValueError(f"max_depth is missing lane(s): {', '.join(missing)}.")
+        bad_depths = sorted(lane for lane in weights if _positive_int(max_depth[lane]) is None)
+        if bad_depths:
+            raise ValueError(f"Lane max_depth must be an integer >= 1: {', '.join(bad_depths)}.")
+
+        self.workers = int(workers)
+        self.weights = {lane: int(weight) for lane, weight in weights.items()}
+        self.max_depth = {lane: int(max_depth[lane]) for lane in weights}
+        self.max_wait = max_wait
+
+        self._cond = threading.Condition()
+        self._queues = {lane: deque() for lane in self.weights}
+        # Stride scheduling: each lane advances its pass by 1/weight per
+        # dequeue, and the non-empty lane with the lowest pass goes next.
+        # _vtime is the pass of the last dispatched ticket; a lane that
+        # becomes backlogged restarts from it, neither banking credit while
+        # idle nor carrying debt from running uncontended.
+        self._pass = {lane: 0.0 for lane in self.weights}
+        self._vtime = 0.0
+        self._running = 0
+        self._avg_service = 30.0
+
+    @property
+    def lanes(self) -> list:
+        return list(self.weights)
+
+    def snapshot(self) -> dict:
+        """Current queue depths and worker utilisation."""
+        with self._cond:
+            return {
+                "queue_depth": {name: len(q) for name, q in self._queues.items()},
+                "running": self._running,
+                "workers": self.workers,
+            }
+
+    def _stats(self, lane: str) -> dict:
+        """Snapshot of queue state. Caller must hold the lock."""
+        return {
+            "lane": lane,
+            "queue_depth": {name: len(q) for name, q in self._queues.items()},
+            "running": self._running,
+            "workers": self.workers,
+        }
+
+    def _retry_after(self) -> int:
+        """Estimate seconds until a retry is likely to be admitted. Caller must hold the lock."""
+        waiting = sum(len(q) for q in self._queues.values())
+        return max(1, int(round(self._avg_service * (waiting + 1) / self.workers)))
+
+    def _dispatch(self):
+        """Grant free worker slots to queued tickets. Caller must hold the lock."""
+        granted = False
+        while self._running < self.workers:
+            ready = [lane for lane, q in self._queues.items() if q]
+            if not ready:
+                break
+            lane = min(ready, key=lambda name: self._pass[name])
+            ticket = self._queues[lane].popleft()
+            self._vtime = self._pass[lane]
+            self._pass[lane] += 1.0 / self.weights[lane]
+            ticket.granted = True
+            self._running += 1
+            granted = True
+        if granted:
+            self._cond.notify_all()
+
+    def _acquire(self, lane: str) -> _Ticket:
+        with self._cond:
+            queue = self._queues[lane]
+            if len(queue) >= self.max_depth[lane]:
+                raise SchedulerSaturated(
+                    f"The {lane} queue is full. Please retry later.",
+                    lane, self._retry_after(), self._stats(lane),
+                )
+
+            if not queue:
+                self._pass[lane] = self._vtime
+
+            ticket = _Ticket(lane)
+            queue.append(ticket)
+            self._dispatch()
+
+            deadline = ticket.enqueued_at + self.max_wait
+            while not ticket.granted:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    queue.remove(ticket)
+                    raise SchedulerSaturated(
+                        f"Timed out waiting in the {lane} queue. Please retry later.",
+                        lane, self._retry_after(), self._stats(lane),
+                    )
+                self._cond.wait(remaining)
+            return ticket
+
+    def _release(self, service_seconds: float):
+        with self._cond:
+            self._running -= 1
+            self._avg_service = 0.8 * self._avg_service + 0.2 * service_seconds
+            self._dispatch()
+
+    def run(self, lane: str, func, *args, **kwargs):
+        """
+        Run func in the given lane once a worker slot is available.
+
+        Returns:
+            (result, queue_info) where queue_info reports the lane, queue
+            depths at admission and the time spent waiting for a slot.
+
+        Raises:
+            ValueError: If the lane is unknown.
+            SchedulerSaturated: If the lane is full or the wait times out.
+            Exception: Anything raised by func, with the same queue_info
+                attached as its ``queue_info`` attribute.
+        """
+        if lane not in self._queues:
+            raise ValueError(f"Unknown priority lane '{lane}'. Expected one of: {', '.join(self.lanes)}.")
+
+        with self._cond:
+            depth_at_enqueue = self._stats(lane)["queue_depth"]
+
+        ticket = self._acquire(lane)
+        started = time.time()
+        queue_info = {
+            "lane": lane,
+            "queue_depth_at_enqueue": depth_at_enqueue,
+            "wait_seconds": round(started - ticket.enqueued_at, 3),
+        }
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            e.queue_info = queue_info
+            raise
+        finally:
+            self._release(time.time() - started)
+
+        return result, queue_info
@@ -8,9 +8,26 @@ import os
 import json
 from flask import Flask, request, jsonify, render_template, send_from_directory
 from detector import AIDetector, DetectionError
+from normalizer import TextNormalizer
+from scheduler import PriorityScheduler, SchedulerSaturated, LANE_INTERACTIVE, LANE_BATCH
 
 app = Flask(__name__, static_folder="static", template_folder="templates")
 
+# Raw environment strings are validated by PriorityScheduler, so a bad
+# value fails at startup with a message naming the offending lane.
+scheduler = PriorityScheduler(
+    workers=os.environ.get("DETECT_WORKERS", 4),
+    weights={
+        LANE_INTERACTIVE: os.environ.get("INTERACTIVE_WEIGHT", 4),
+        LANE_BATCH: os.environ.get("BATCH_WEIGHT", 1),
+    },
+    max_depth={
+        LANE_INTERACTIVE: os.environ.get("INTERACTIVE_MAX_QUEUE", 32),
+        LANE_BATCH: os.environ.get("BATCH_MAX_QUEUE", 256),
+    },
+    max_wait=float(os.environ.get("QUEUE_MAX_WAIT", 300)),
+)
+
 
 @app.route("/")
 def index():
@@ -19,7 +36,18 @@ def index():
 
 @app.route("/api/detect", methods=["POST"])
 def detect():
-    """Run AI content detection on submitted text."""
+    """Run AI content detection on submitted text (interactive lane)."""
+    return _detect_in_lane(LANE_INTERACTIVE)
+
+
+@app.route("/api/detect/batch", methods=["POST"])
+def detect_batch():
+    """Run AI content detection for bulk imports (batch lane)."""
+    return _detect_in_lane(LANE_BATCH)
+
+
+def _detect_in_lane(lane: str):
+    """Validate the request and run detection through the given scheduler lane."""
     data = request.get_json()
     if not data:
         return jsonify({"error": "Request body must be JSON."}), 400
@@ -29,6 +57,8 @@ def detect():
     api_key = data.get("api_key", "").strip()
     model = data.get("model", "").strip()
     temperature = data.get("temperature", 0.1)
+    parallel_rounds = data.get("parallel_rounds", False)
+    normalize = data.get("normalize", False)
 
     # Validation
     errors = []
@@ -40,6 +70,15 @@ def detect():
         errors.append("API Key is required.")
     if not model:
         errors.append("Model name is required.")
+    if not isinstance(parallel_rounds, bool):
+        errors.append("Parallel rounds must be true or false.")
+    try:
+        normalizer = TextNormalizer.from_options(normalize)
+        if not normalizer.enabled:
+            # "Off" sends the input through untouched and reports no stats.
+            normalizer = None
+    except ValueError as e:
+        errors.append(str(e))
     if errors:
         return jsonify({"error": " ".join(errors)}), 400
 
@@ -49,18 +88,24 @@ def detect():
             api_key=api_key,
             model=model,
             temperature=float(temperature),
+            parallel_rounds=parallel_rounds,
+            normalizer=normalizer,
         )
-        result = detector.detect(text)
-        return jsonify({"success": True, "result": result})
+        result, queue_info = scheduler.run(lane, detector.detect, text)
+        return jsonify({"success": True, "result": result, "queue": queue_info})
+    except SchedulerSaturated as e:
+        resp = jsonify({"error": str(e), "queue": e.stats, "retry_after": e.retry_after})
+        resp.headers["Retry-After"] = str(e.retry_after)
+        return resp, 503
     except DetectionError as e:
-        return jsonify({"error": str(e)}), 422
+        return jsonify({"error": str(e), "queue": getattr(e, "queue_info", None)}), 422
     except Exception as e:
-        return jsonify({"error": f"Internal error: {str(e)}"}), 500
+        return jsonify({"error": f"Internal error: {str(e)}", "queue": getattr(e, "queue_info", None)}), 500
 
 
 @app.route("/api/health")
 def health():
-    return jsonify({"status": "ok"})
+    return jsonify({"status": "ok", "queue": scheduler.snapshot()})
 
 
 if __name__ == "__main__":
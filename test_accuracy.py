@@ -2,12 +2,20 @@
 AI Content Detector - Accuracy Test Suite
 
 Tests with known human-written and AI-generated samples.
+
+Usage:
+    python test_accuracy.py                       # sequential rounds (default)
+    python test_accuracy.py --parallel            # parallel-round mode
+    python test_accuracy.py --normalize           # all normalization steps, including lossy ones
+    python test_accuracy.py --compare             # sequential vs parallel-round mode
+    python test_accuracy.py --compare-normalize   # raw input vs fully normalized input
 """
 
 import json
 import sys
 import time
 from detector import AIDetector, DetectionError
+from normalizer import TextNormalizer
 
 API_BASE = "https://arenac-2api.rand0mk4cas.workers.dev/v1"
 API_KEY = "sk-dummy-67ujhgfrtyujhgfdert6yujhgfrtyhn"
@@ -73,12 +81,21 @@ SAMPLES = [
 ]
 
 
-def run_tests():
+def _full_normalizer():
+    """Normalizer with every step enabled, lossy ones included."""
+    return TextNormalizer.from_options({name: True for name in TextNormalizer().steps()})
+
+
+def run_tests(parallel_rounds=False, normalizer=None, results_path="test_results.json"):
+    mode = "parallel" if parallel_rounds else "sequential"
+    if normalizer is not None:
+        mode += "+normalized"
     print("=" * 60)
     print("  AI Content Detector - Accuracy Test Suite")
     print("=" * 60)
     print(f"  API: {API_BASE}")
     print(f"  Model: {MODEL}")
+    print(f"  Mode: {mode}")
     print(f"  Samples: {len(SAMPLES)}")
     print("=" * 60)
 
@@ -88,6 +105,8 @@ def run_tests():
         model=MODEL,
         temperature=0.1,
         timeout=180,
+        parallel_rounds=parallel_rounds,
+        normalizer=normalizer,
     )
 
     results = []
@@ -128,6 +147,7 @@ def run_tests():
                 "ai_probability": ai_prob,
                 "correct": is_correct,
                 "elapsed": result.get("elapsed_seconds", 0),
+                "normalization": result.get("input_normalization"),
             })
 
         except DetectionError as e:
@@ -171,14 +191,52 @@ def run_tests():
 
     print("=" * 60)
 
+    timed = [r["elapsed"] for r in results if "error" not in r]
+    avg_elapsed = round(sum(timed) / len(timed), 2) if timed else 0
+
     # Save results
-    with open("test_results.json", "w", encoding="utf-8") as f:
-        json.dump({"accuracy": accuracy, "correct": correct, "total": total, "results": results}, f, indent=2, ensure_ascii=False)
-    print("  Results saved to test_results.json")
+    with open(results_path, "w", encoding="utf-8") as f:
+        json.dump({"mode": mode, "accuracy": accuracy, "correct": correct, "total": total,
+                   "avg_elapsed": avg_elapsed, "results": results}, f, indent=2, ensure_ascii=False)
+    print(f"  Results saved to {results_path}")
+
+    return accuracy, avg_elapsed, results
+
 
-    return accuracy
+def compare_modes(variant_label, variant_kwargs, variant_path):
+    """Run the suite on the sequential baseline and one variant and compare."""
+    base_acc, base_time, base_results = run_tests(results_path="test_results.json")
+    var_acc, var_time, var_results = run_tests(results_path=variant_path, **variant_kwargs)
+
+    print("\n" + "=" * 60)
+    print("  MODE COMPARISON")
+    print("=" * 60)
+    print(f"  {'Mode':<14}{'Accuracy':>10}{'Avg time':>12}")
+    print(f"  {'sequential':<14}{base_acc:>9.1f}%{base_time:>11.2f}s")
+    print(f"  {variant_label:<14}{var_acc:>9.1f}%{var_time:>11.2f}s")
+
+    disagreements = [
+        (b["desc"], b["verdict"], v["verdict"])
+        for b, v in zip(base_results, var_results)
+        if b["verdict"] != v["verdict"]
+    ]
+    if disagreements:
+        print("\n  Verdict differences:")
+        for desc, base_verdict, var_verdict in disagreements:
+            print(f"    {desc}: {base_verdict} -> {var_verdict}")
+    print("=" * 60)
+
+    return min(base_acc, var_acc)
 
 
 if __name__ == "__main__":
-    acc = run_tests()
+    if "--compare" in sys.argv:
+        acc = compare_modes("parallel", {"parallel_rounds": True}, "test_results_parallel.json")
+    elif "--compare-normalize" in sys.argv:
+        acc = compare_modes("normalized", {"normalizer": _full_normalizer()}, "test_results_normalized.json")
+    else:
+        acc, _, _ = run_tests(
+            parallel_rounds="--parallel" in sys.argv,
+            normalizer=_full_normalizer() if "--normalize" in sys.argv else None,
+        )
     sys.exit(0 if acc >= 90 else 1)